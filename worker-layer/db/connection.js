@@ -0,0 +1,60 @@
+// db/connection.js
+// Shared MongoDB client setup for long-running Phoenix processes
+import { MongoClient } from 'mongodb';
+
+const DB_NAME = 'phoenix';
+
+let clientPromise = null;
+
+function envInt(name, fallback) {
+  const value = parseInt(process.env[name], 10);
+  return Number.isNaN(value) ? fallback : value;
+}
+
+// Pool tuned for 1Hz heartbeat/poll loops: keep warm sockets around
+// instead of paying a TCP+TLS handshake whenever the pool drains.
+export function mongoClientOptions(appName = 'phoenix-worker-layer') {
+  return {
+    maxPoolSize: envInt('MONGODB_MAX_POOL_SIZE', 50),
+    minPoolSize: envInt('MONGODB_MIN_POOL_SIZE', 5),
+    maxIdleTimeMS: envInt('MONGODB_MAX_IDLE_TIME_MS', 300000),
+    serverSelectionTimeoutMS: envInt('MONGODB_SERVER_SELECTION_TIMEOUT_MS', 3000),
+    socketTimeoutMS: envInt('MONGODB_SOCKET_TIMEOUT_MS', 10000),
+    retryWrites: true,
+    appName
+  };
+}
+
+export function createMongoClient(appName) {
+  return new MongoClient(process.env.MONGODB_URI, mongoClientOptions(appName));
+}
+
+// Process-wide client. Caching the connect() promise (not the client)
+// means concurrent first callers all await the same connection.
+// appName only takes effect on the call that creates the client; later
+// callers get the existing client whatever name they pass.
+// Owners must call closeMongoClient() on shutdown: an open pool keeps
+// the event loop alive, so there is no implicit exit hook.
+export function getMongoClient(appName) {
+  if (!clientPromise) {
+    const client = createMongoClient(appName);
+    clientPromise = client.connect().catch(error => {
+      clientPromise = null;
+      throw error;
+    });
+  }
+  return clientPromise;
+}
+
+export async function getDatabase(appName) {
+  const client = await getMongoClient(appName);
+  return client.db(DB_NAME);
+}
+
+export async function closeMongoClient() {
+  if (!clientPromise) return;
+  const pending = clientPromise;
+  clientPromise = null;
+  const client = await pending.catch(() => null);
+  if (client) await client.close();
+}
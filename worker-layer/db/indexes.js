@@ -0,0 +1,46 @@
+// db/indexes.js
+// Index definitions for the Phoenix collections (spec section 4)
+// createIndexes is a no-op for indexes that already exist, so this is
+// safe to run on every process start.
+const INDEXES = {
+  workflows: [
+    { key: { status: 1 } },
+    { key: { created_at: -1 } }
+  ],
+  tasks: [
+    // Worker claim: PENDING + type, FIFO by created_at
+    { key: { status: 1, type: 1, created_at: 1 } },
+    // Workflow view / status rollup
+    { key: { workflow_id: 1 } },
+    // Lock timeout recovery (spec 5.3)
+    { key: { status: 1, locked_at: 1 } },
+    // Dependency resolution
+    { key: { dependencies: 1 } }
+  ],
+  logs: [
+    { key: { timestamp: -1 } },
+    { key: { workflow_id: 1, timestamp: -1 } },
+    { key: { task_id: 1 } },
+    { key: { level: 1 } },
+    { key: { component: 1 } },
+    // Recovery event feed: only tagged entries are indexed
+    {
+      key: { event_type: 1, timestamp: -1 },
+      partialFilterExpression: { event_type: { $exists: true } }
+    }
+  ],
+  workers: [
+    { key: { workerId: 1 }, unique: true },
+    // Dead-worker scan: ONLINE workers with a stale heartbeat
+    { key: { status: 1, lastHeartbeat: 1 } },
+    { key: { lastHeartbeat: 1 } }
+  ]
+};
+
+export async function ensureIndexes(db) {
+  await Promise.all(
+    Object.entries(INDEXES).map(([name, specs]) =>
+      db.collection(name).createIndexes(specs)
+    )
+  );
+}
@@ -0,0 +1,55 @@
+// db/logBuffer.js
+// Batches log documents into insertMany calls off the caller's path.
+// Delivery is best-effort: a batch whose insert fails is retried once and
+// then dropped (reported via console.error), and entries still pending
+// when the process dies without close() are lost.
+export class LogBuffer {
+  constructor(collection, { maxBatch = 500, flushIntervalMs = 500 } = {}) {
+    this.collection = collection;
+    this.maxBatch = maxBatch;
+    this.flushIntervalMs = flushIntervalMs;
+    this.pending = [];
+    this.timer = null;
+    this.inFlight = Promise.resolve();
+  }
+
+  push(doc) {
+    this.pending.push(doc);
+    if (this.pending.length >= this.maxBatch) {
+      this.flush();
+    } else if (!this.timer) {
+      this.timer = setTimeout(() => this.flush(), this.flushIntervalMs);
+      this.timer.unref();
+    }
+  }
+
+  // Flushes are chained so batches land in the order they were queued
+  flush() {
+    clearTimeout(this.timer);
+    this.timer = null;
+    if (this.pending.length === 0) return this.inFlight;
+
+    const batch = this.pending;
+    this.pending = [];
+    this.inFlight = this.inFlight.then(() => this.write(batch));
+    return this.inFlight;
+  }
+
+  // insertMany assigns _id on the first attempt, so a retry after a
+  // partial write cannot duplicate the entries that already landed
+  async write(batch) {
+    try {
+      await this.collection.insertMany(batch, { ordered: false });
+    } catch {
+      try {
+        await this.collection.insertMany(batch, { ordered: false });
+      } catch (error) {
+        console.error(`❌ Dropped ${batch.length} log entries after retry: ${error.message}`);
+      }
+    }
+  }
+
+  async close() {
+    await this.flush();
+  }
+}
@@ -1,5 +1,5 @@
 import dotenv from 'dotenv';
-import { MongoClient } from 'mongodb';
+import { createMongoClient } from '../db/connection.js';
 import { fileURLToPath } from 'url';
 import { dirname, join } from 'path';
 
@@ -17,7 +17,7 @@ if (!uri) {
   process.exit(1);
 }
 
-const client = new MongoClient(uri);
+const client = createMongoClient('phoenix-orchestrator');
 
 async function startOrchestrator() {
   try {
@@ -33,13 +33,16 @@ async function startOrchestrator() {
     while (true) {
       
       // --- MISSION 1: UNBLOCK TRAFFIC (Dependency Resolution) ---
-      const blockedTasks = await tasksCollection.find({ status: 'BLOCKED' }).toArray();
+      const blockedTasks = await tasksCollection
+        .find({ status: 'BLOCKED' }, { projection: { dependencies: 1 } })
+        .toArray();
 
       for (const task of blockedTasks) {
         // Look up parents
-        const parents = await tasksCollection.find({ 
-            _id: { $in: task.dependencies } 
-        }).toArray();
+        const parents = await tasksCollection.find(
+            { _id: { $in: task.dependencies } },
+            { projection: { status: 1 } }
+        ).toArray();
 
         // Check if ALL parents are COMPLETED
         // (If dependencies array is empty, it shouldn't be blocked, so we default to true)
@@ -57,10 +60,13 @@ async function startOrchestrator() {
       // --- MISSION 2: RESCUE ZOMBIES (Resilience) ---
       const fiveMinutesAgo = new Date(Date.now() - 5 * 60 * 1000);
       
-      const zombies = await tasksCollection.find({
-        status: 'IN_PROGRESS',
-        locked_at: { $lt: fiveMinutesAgo }
-      }).toArray();
+      const zombies = await tasksCollection.find(
+        {
+          status: 'IN_PROGRESS',
+          locked_at: { $lt: fiveMinutesAgo }
+        },
+        { projection: { retry_count: 1, max_retries: 1 } }
+      ).toArray();
 
       for (const zombie of zombies) {
         if (zombie.retry_count < (zombie.max_retries || 3)) {
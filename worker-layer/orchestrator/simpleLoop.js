@@ -1,20 +1,25 @@
 // orchestrator/simpleLoop.js
 // Simple orchestrator loop for demo - Aarzoo should replace this
 import 'dotenv/config';
-import { MongoClient } from 'mongodb';
+import { getDatabase, closeMongoClient } from '../db/connection.js';
+import { ensureIndexes } from '../db/indexes.js';
 
 const LOCK_TIMEOUT_MS = 5 * 60 * 1000; // 5 minutes
+const POLL_INTERVAL_MS = 1000; // Poll every second
 
 async function orchestratorLoop() {
   console.log('🧠 Phoenix Orchestrator Loop Starting...\n');
 
-  const client = new MongoClient(process.env.MONGODB_URI);
-  await client.connect();
-  const db = client.db('phoenix');
+  const db = await getDatabase('phoenix-orchestrator');
+  await ensureIndexes(db);
 
   let iteration = 0;
+  // Scheduled on the monotonic clock so the cadence stays at one tick per
+  // interval regardless of how long each pass spends waiting on MongoDB
+  let nextTick = performance.now();
 
   while (true) {
+    nextTick += POLL_INTERVAL_MS;
     try {
       iteration++;
       
@@ -23,24 +28,41 @@ async function orchestratorLoop() {
       // Find BLOCKED tasks and check if deps are done
       // =============================================
       const blockedTasks = await db.collection('tasks')
-        .find({ status: 'BLOCKED' })
+        .find({ status: 'BLOCKED' }, { projection: { dependencies: 1 } })
         .toArray();
 
+      // Fetch every referenced dependency in one query instead of one per task
+      const depIds = [...new Set(blockedTasks.flatMap(t => t.dependencies || []))];
+      // Keyed by String(_id): ObjectId dependencies would never match by reference
+      const depsById = new Map();
+      if (depIds.length > 0) {
+        const allDeps = await db.collection('tasks')
+          .find(
+            { _id: { $in: depIds } },
+            { projection: { status: 1, output_artifact: 1 } }
+          )
+          .toArray();
+        allDeps.forEach(d => depsById.set(String(d._id), d));
+      }
+
+      const unblockOps = [];
       for (const task of blockedTasks) {
         if (!task.dependencies || task.dependencies.length === 0) {
           // No dependencies, unblock immediately
-          await db.collection('tasks').updateOne(
-            { _id: task._id },
-            { $set: { status: 'PENDING' } }
-          );
+          unblockOps.push({
+            updateOne: {
+              filter: { _id: task._id },
+              update: { $set: { status: 'PENDING' } }
+            }
+          });
           console.log(`   ✅ Unblocked ${task._id} (no dependencies)`);
           continue;
         }
 
         // Check if all dependencies are COMPLETED
-        const deps = await db.collection('tasks')
-          .find({ _id: { $in: task.dependencies } })
-          .toArray();
+        const deps = task.dependencies
+          .map(id => depsById.get(String(id)))
+          .filter(Boolean);
 
         const allDepsCompleted = deps.every(d => d.status === 'COMPLETED');
         const anyDepFailed = deps.some(d => d.status === 'FAILED');
@@ -54,26 +76,34 @@ async function orchestratorLoop() {
             }
           });
 
-          await db.collection('tasks').updateOne(
-            { _id: task._id },
-            { 
-              $set: { 
-                status: 'PENDING',
-                'input_context.dependency_outputs': depOutputs
-              } 
+          unblockOps.push({
+            updateOne: {
+              filter: { _id: task._id },
+              update: {
+                $set: {
+                  status: 'PENDING',
+                  'input_context.dependency_outputs': depOutputs
+                }
+              }
             }
-          );
+          });
           console.log(`   ✅ Unblocked ${task._id} (all ${deps.length} deps completed)`);
         } else if (anyDepFailed) {
           // Dependency failed, mark this as failed too
-          await db.collection('tasks').updateOne(
-            { _id: task._id },
-            { $set: { status: 'FAILED', last_error: 'Dependency failed' } }
-          );
+          unblockOps.push({
+            updateOne: {
+              filter: { _id: task._id },
+              update: { $set: { status: 'FAILED', last_error: 'Dependency failed' } }
+            }
+          });
           console.log(`   ❌ Failed ${task._id} (dependency failed)`);
         }
       }
 
+      if (unblockOps.length > 0) {
+        await db.collection('tasks').bulkWrite(unblockOps, { ordered: false });
+      }
+
       // =============================================
       // STEP 2: Lock Timeout Recovery (Spec 5.3)
       // Find IN_PROGRESS tasks locked > 5 minutes
@@ -81,35 +111,43 @@ async function orchestratorLoop() {
       const stuckThreshold = new Date(Date.now() - LOCK_TIMEOUT_MS);
       
       const stuckTasks = await db.collection('tasks')
-        .find({
-          status: 'IN_PROGRESS',
-          locked_at: { $lt: stuckThreshold }
-        })
+        .find(
+          {
+            status: 'IN_PROGRESS',
+            locked_at: { $lt: stuckThreshold }
+          },
+          { projection: { retry_count: 1, max_retries: 1 } }
+        )
         .toArray();
 
-      for (const task of stuckTasks) {
+      const recoveryOps = stuckTasks.map(task => {
         const newRetryCount = (task.retry_count || 0) + 1;
         const maxRetries = task.max_retries || 3;
 
         if (newRetryCount <= maxRetries) {
           // Reset to PENDING for retry
-          await db.collection('tasks').updateOne(
-            { _id: task._id },
-            {
-              $set: {
-                status: 'PENDING',
-                worker_lock: null,
-                locked_at: null,
-                retry_count: newRetryCount
+          console.log(`   🔄 Recovered stuck task ${task._id} (retry ${newRetryCount}/${maxRetries})`);
+          return {
+            updateOne: {
+              filter: { _id: task._id },
+              update: {
+                $set: {
+                  status: 'PENDING',
+                  worker_lock: null,
+                  locked_at: null,
+                  retry_count: newRetryCount
+                }
               }
             }
-          );
-          console.log(`   🔄 Recovered stuck task ${task._id} (retry ${newRetryCount}/${maxRetries})`);
-        } else {
-          // Max retries exceeded
-          await db.collection('tasks').updateOne(
-            { _id: task._id },
-            {
+          };
+        }
+
+        // Max retries exceeded
+        console.log(`   ❌ Failed ${task._id} after ${maxRetries} retries`);
+        return {
+          updateOne: {
+            filter: { _id: task._id },
+            update: {
               $set: {
                 status: 'FAILED',
                 worker_lock: null,
@@ -117,30 +155,40 @@ async function orchestratorLoop() {
                 last_error: 'Lock timeout after max retries'
               }
             }
-          );
-          console.log(`   ❌ Failed ${task._id} after ${maxRetries} retries`);
-        }
+          }
+        };
+      });
+
+      if (recoveryOps.length > 0) {
+        await db.collection('tasks').bulkWrite(recoveryOps, { ordered: false });
       }
 
       // =============================================
       // STEP 3: Update Workflow Status
       // =============================================
       const workflows = await db.collection('workflows')
-        .find({ status: { $in: ['PENDING', 'RUNNING'] } })
+        .find({ status: { $in: ['PENDING', 'RUNNING'] } }, { projection: { status: 1 } })
         .toArray();
 
       for (const wf of workflows) {
-        const tasks = await db.collection('tasks')
-          .find({ workflow_id: wf._id })
-          .toArray();
+        // Only statuses are needed; stream them instead of pulling
+        // whole task documents (output artifacts can be large)
+        const cursor = db.collection('tasks')
+          .find({ workflow_id: wf._id }, { projection: { _id: 0, status: 1 } })
+          .batchSize(200);
 
-        if (tasks.length === 0) continue;
+        let taskCount = 0;
+        let allCompleted = true;
+        let anyFailed = false;
+        let anyInProgress = false;
+        for await (const t of cursor) {
+          taskCount++;
+          if (t.status !== 'COMPLETED') allCompleted = false;
+          if (t.status === 'FAILED') anyFailed = true;
+          if (t.status === 'IN_PROGRESS' || t.status === 'PENDING') anyInProgress = true;
+        }
 
-        const allCompleted = tasks.every(t => t.status === 'COMPLETED');
-        const anyFailed = tasks.some(t => t.status === 'FAILED');
-        const anyInProgress = tasks.some(t => 
-          t.status === 'IN_PROGRESS' || t.status === 'PENDING'
-        );
+        if (taskCount === 0) continue;
 
         let newStatus = wf.status;
         if (allCompleted) {
@@ -177,11 +225,17 @@ async function orchestratorLoop() {
           `❌${counts.FAILED || 0}\n`);
       }
 
-      await sleep(1000); // Poll every second
+      const delay = nextTick - performance.now();
+      if (delay > 0) {
+        await sleep(delay);
+      } else {
+        nextTick = performance.now(); // Overran the tick; don't burst to catch up
+      }
 
     } catch (error) {
       console.error('❌ Orchestrator error:', error.message);
       await sleep(5000);
+      nextTick = performance.now();
     }
   }
 }
@@ -190,4 +244,13 @@ function sleep(ms) {
   return new Promise(resolve => setTimeout(resolve, ms));
 }
 
+// Graceful shutdown
+for (const signal of ['SIGINT', 'SIGTERM']) {
+  process.on(signal, async () => {
+    console.log(`\n🛑 Received ${signal}, closing MongoDB connection...`);
+    await closeMongoClient();
+    process.exit(0);
+  });
+}
+
 orchestratorLoop().catch(console.error);
\ No newline at end of file
@@ -2,6 +2,7 @@
 // Database setup matching Project Phoenix spec exactly
 import 'dotenv/config';
 import { MongoClient } from 'mongodb';
+import { ensureIndexes } from '../db/indexes.js';
 
 async function setupPhoenixDatabase() {
   const client = new MongoClient(process.env.MONGODB_URI);
@@ -17,46 +18,30 @@ async function setupPhoenixDatabase() {
     // ============================================
     console.log('Creating workflows collection...');
     await db.createCollection('workflows');
-    await db.collection('workflows').createIndex({ status: 1 });
-    await db.collection('workflows').createIndex({ created_at: -1 });
 
     // ============================================
     // TASKS COLLECTION (Spec 4.2)
     // ============================================
     console.log('Creating tasks collection...');
     await db.createCollection('tasks');
-    
-    // For finding pending tasks by type (worker claim)
-    await db.collection('tasks').createIndex({ status: 1, type: 1 });
-    
-    // For finding tasks by workflow
-    await db.collection('tasks').createIndex({ workflow_id: 1 });
-    
-    // For lock timeout recovery (spec 5.3)
-    await db.collection('tasks').createIndex({ status: 1, locked_at: 1 });
-    
-    // For dependency resolution
-    await db.collection('tasks').createIndex({ dependencies: 1 });
 
     // ============================================
     // LOGS COLLECTION (Spec 4.3 - Immutable)
     // ============================================
     console.log('Creating logs collection...');
     await db.createCollection('logs');
-    await db.collection('logs').createIndex({ timestamp: -1 });
-    await db.collection('logs').createIndex({ workflow_id: 1, timestamp: -1 });
-    await db.collection('logs').createIndex({ task_id: 1 });
-    await db.collection('logs').createIndex({ level: 1 });
-    await db.collection('logs').createIndex({ component: 1 });
 
     // ============================================
     // WORKERS COLLECTION (For watchdog)
     // ============================================
     console.log('Creating workers collection...');
     await db.createCollection('workers');
-    await db.collection('workers').createIndex({ workerId: 1 }, { unique: true });
-    await db.collection('workers').createIndex({ status: 1 });
-    await db.collection('workers').createIndex({ lastHeartbeat: 1 });
+
+    // ============================================
+    // INDEXES (shared with runtime startup, see db/indexes.js)
+    // ============================================
+    console.log('Creating indexes...');
+    await ensureIndexes(db);
 
     // ============================================
     // INSERT SAMPLE DATA FOR TESTING
@@ -72,7 +57,7 @@ async function setupPhoenixDatabase() {
         _id: sampleWorkflowId,
         goal: 'Deploy Minecraft Server on AWS',
         status: 'PENDING',
-        created_at: new Date().toISOString(),
+        created_at: new Date(),
         context_summary: 'Demo workflow for Phoenix hackathon'
       });
 
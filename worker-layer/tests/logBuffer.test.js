@@ -0,0 +1,151 @@
+// tests/logBuffer.test.js
+// Unit tests for the batched log writer (no MongoDB needed)
+import { LogBuffer } from '../db/logBuffer.js';
+
+function sleep(ms) {
+  return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+// Records every insertMany call; fails the first `failures` calls
+function fakeCollection(failures = 0) {
+  return {
+    calls: [],
+    async insertMany(docs, options) {
+      this.calls.push({ docs: [...docs], options });
+      if (failures > 0) {
+        failures--;
+        throw new Error('simulated insert failure');
+      }
+    }
+  };
+}
+
+async function testSizeTriggeredFlush() {
+  console.log('\n=== Test: Size-triggered flush ===');
+  const col = fakeCollection();
+  const buffer = new LogBuffer(col, { maxBatch: 3, flushIntervalMs: 10000 });
+
+  buffer.push({ n: 1 });
+  buffer.push({ n: 2 });
+  console.assert(col.calls.length === 0, '❌ Should not flush below maxBatch');
+  buffer.push({ n: 3 });
+  await buffer.inFlight;
+
+  console.assert(col.calls.length === 1, '❌ Should flush once at maxBatch');
+  console.assert(col.calls[0].docs.length === 3, '❌ Batch should hold 3 entries');
+  console.assert(col.calls[0].options.ordered === false, '❌ insertMany should be unordered');
+  console.assert(buffer.timer === null, '❌ Flush should clear the pending timer');
+  console.log('✅ Size-triggered flush test passed');
+}
+
+async function testTimerTriggeredFlush() {
+  console.log('\n=== Test: Timer-triggered flush ===');
+  const col = fakeCollection();
+  const buffer = new LogBuffer(col, { maxBatch: 100, flushIntervalMs: 20 });
+
+  buffer.push({ n: 1 });
+  buffer.push({ n: 2 });
+  console.assert(col.calls.length === 0, '❌ Should not flush immediately');
+  await sleep(50);
+  await buffer.inFlight;
+
+  console.assert(col.calls.length === 1, '❌ Timer should flush once');
+  console.assert(col.calls[0].docs.length === 2, '❌ Timer flush should hold both entries');
+  console.log('✅ Timer-triggered flush test passed');
+}
+
+async function testBatchOrderPreserved() {
+  console.log('\n=== Test: Batch order preserved ===');
+  const col = fakeCollection();
+  // Slow first insert: the second batch must still land after it
+  const original = col.insertMany.bind(col);
+  let first = true;
+  col.insertMany = async (docs, options) => {
+    if (first) {
+      first = false;
+      await sleep(30);
+    }
+    return original(docs, options);
+  };
+  const buffer = new LogBuffer(col, { maxBatch: 2, flushIntervalMs: 10000 });
+
+  for (let n = 1; n <= 6; n++) buffer.push({ n });
+  await buffer.close();
+
+  const order = col.calls.flatMap(c => c.docs.map(d => d.n));
+  console.assert(col.calls.length === 3, '❌ Should write 3 batches');
+  console.assert(order.join(',') === '1,2,3,4,5,6', `❌ Entries out of order: ${order}`);
+  console.log('✅ Batch order test passed');
+}
+
+async function testCloseDrainsPending() {
+  console.log('\n=== Test: close() drains pending entries ===');
+  const col = fakeCollection();
+  const buffer = new LogBuffer(col, { maxBatch: 100, flushIntervalMs: 10000 });
+
+  buffer.push({ n: 1 });
+  buffer.push({ n: 2 });
+  await buffer.close();
+
+  console.assert(col.calls.length === 1, '❌ close() should flush pending entries');
+  console.assert(col.calls[0].docs.length === 2, '❌ close() should flush both entries');
+  console.assert(buffer.pending.length === 0, '❌ Nothing should remain pending');
+  console.assert(buffer.timer === null, '❌ close() should clear the timer');
+  console.log('✅ close() drain test passed');
+}
+
+async function testFailedBatchRetriedOnce() {
+  console.log('\n=== Test: Failed batch is retried once ===');
+  const col = fakeCollection(1);
+  const buffer = new LogBuffer(col, { maxBatch: 100, flushIntervalMs: 10000 });
+
+  buffer.push({ n: 1 });
+  await buffer.close();
+
+  console.assert(col.calls.length === 2, '❌ Failed batch should be retried once');
+  console.assert(col.calls[1].docs[0].n === 1, '❌ Retry should resend the same batch');
+  console.log('✅ Retry test passed');
+}
+
+async function testFailedBatchDroppedAfterRetry() {
+  console.log('\n=== Test: Batch dropped after retry fails ===');
+  const col = fakeCollection(2);
+  const buffer = new LogBuffer(col, { maxBatch: 100, flushIntervalMs: 10000 });
+
+  const errors = [];
+  const consoleError = console.error;
+  console.error = msg => errors.push(msg);
+  try {
+    buffer.push({ n: 1 });
+    await buffer.close();
+  } finally {
+    console.error = consoleError;
+  }
+
+  console.assert(col.calls.length === 2, '❌ Should stop after one retry');
+  console.assert(errors.length === 1, '❌ Dropped batch should be reported once');
+
+  // The chain must survive the failure so later batches still write
+  buffer.push({ n: 2 });
+  await buffer.close();
+  console.assert(col.calls.length === 3, '❌ Later batches should still be written');
+  console.assert(col.calls[2].docs[0].n === 2, '❌ Later batch should hold the new entry');
+  console.log('✅ Drop-after-retry test passed');
+}
+
+async function runAllTests() {
+  console.log('🧪 Starting LogBuffer Tests\n');
+  console.log('='.repeat(50));
+
+  await testSizeTriggeredFlush();
+  await testTimerTriggeredFlush();
+  await testBatchOrderPreserved();
+  await testCloseDrainsPending();
+  await testFailedBatchRetriedOnce();
+  await testFailedBatchDroppedAfterRetry();
+
+  console.log('\n' + '='.repeat(50));
+  console.log('✅ All LogBuffer tests completed!');
+}
+
+runAllTests().catch(console.error);
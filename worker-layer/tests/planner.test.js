@@ -18,7 +18,7 @@ async function testPlanner() {
       _id: workflowId,
       goal: 'Build a REST API with authentication',
       status: 'PENDING',
-      created_at: new Date().toISOString()
+      created_at: new Date()
     });
     console.log('✅ Created workflow:', workflowId);
 
@@ -1,6 +1,9 @@
 // worker/AdvancedWorkers.js
 import { BaseWorker } from './BaseWorker.js';
 
+// Strips ```json fences from LLM replies; built once per module, not per call
+const JSON_FENCE_RE = /```json\n?|\n?```/g;
+
 // Planner Worker - Decomposes complex tasks into subtasks
 export class PlannerWorker extends BaseWorker {
   constructor(workerId) {
@@ -65,7 +68,7 @@ Return ONLY valid JSON, no markdown.`;
     
     let plan;
     try {
-      plan = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      plan = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       plan = { rawPlan: response, parseError: true };
     }
@@ -132,7 +135,7 @@ Return as JSON with structure:
     const response = await this.callLLM(prompt);
     let workflow;
     try {
-      workflow = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      workflow = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       workflow = { rawWorkflow: response };
     }
@@ -153,7 +156,7 @@ Return JSON: { "prioritizedTasks": [...tasks with priority scores], "reasoning":
     const response = await this.callLLM(prompt);
     let result;
     try {
-      result = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      result = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       result = { rawResult: response };
     }
@@ -208,7 +211,7 @@ Return JSON: { "title": "...", "mainContent": "...", "metadata": {...} }`;
       const extracted = await this.callLLM(prompt);
       let content;
       try {
-        content = JSON.parse(extracted.replace(/```json\n?|\n?```/g, '').trim());
+        content = JSON.parse(extracted.replace(JSON_FENCE_RE, '').trim());
       } catch (e) {
         content = { rawContent: extracted };
       }
@@ -306,7 +309,7 @@ Return JSON: { "combined": {...}, "conflicts": [...], "confidence": 0-100, "summ
     const response = await this.callLLM(prompt);
     let combined;
     try {
-      combined = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      combined = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       combined = { rawCombined: response };
     }
@@ -577,7 +580,7 @@ Return JSON: {
     const validation = await this.callLLM(prompt);
     let result;
     try {
-      result = JSON.parse(validation.replace(/```json\n?|\n?```/g, '').trim());
+      result = JSON.parse(validation.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       result = { rawValidation: validation };
     }
@@ -650,7 +653,7 @@ Return JSON: { "scores": { "criterion": { "score": N, "explanation": "..." } },
     const quality = await this.callLLM(prompt);
     let result;
     try {
-      result = JSON.parse(quality.replace(/```json\n?|\n?```/g, '').trim());
+      result = JSON.parse(quality.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       result = { rawQuality: quality };
     }
@@ -1,5 +1,5 @@
 // worker/BaseWorker.js
-import { MongoClient, ObjectId } from 'mongodb';
+import { MongoClient } from 'mongodb';
 import Groq from 'groq-sdk';
 import { v4 as uuidv4 } from 'uuid';
 import winston from 'winston';
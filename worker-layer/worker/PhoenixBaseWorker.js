@@ -1,9 +1,10 @@
 // worker/PhoenixBaseWorker.js
 // Aligned with Project Phoenix spec - Failure-Resilient Workers
-import { MongoClient } from 'mongodb';
 import Groq from 'groq-sdk';
 import { v4 as uuidv4 } from 'uuid';
 import winston from 'winston';
+import { getMongoClient } from '../db/connection.js';
+import { LogBuffer } from '../db/logBuffer.js';
 
 // Task status enum (matches spec exactly)
 export const TaskStatus = {
@@ -33,6 +34,14 @@ export const LogLevel = {
   ERROR: 'ERROR'
 };
 
+// Structured event tags for recovery-related logs, so consumers can
+// filter with an indexed equality match instead of regexing messages
+export const LogEvent = {
+  RECOVERY_ATTEMPT: 'recovery_attempt',
+  RECOVERY_SUCCESS: 'recovery_success',
+  TASK_FAILED: 'task_failed'
+};
+
 const logger = winston.createLogger({
   level: 'info',
   format: winston.format.combine(
@@ -49,19 +58,32 @@ export class PhoenixBaseWorker {
     this.taskTypes = config.taskTypes || []; // Task types this worker handles
     this.mongoClient = null;
     this.db = null;
+    this.heartbeats = null;
+    this.heartbeatFilter = { workerId: this.workerId };
+    // Server clock ($currentDate) so heartbeats from different hosts compare cleanly
+    this.heartbeatUpdate = {
+      $currentDate: { lastHeartbeat: true },
+      $set: { status: 'ONLINE' }
+    };
+    this.logBuffer = null;
     this.groq = new Groq({ apiKey: process.env.GROQ_API_KEY });
     this.isRunning = false;
+    this.wakePoller = null;
     this.lockTimeoutMs = 5 * 60 * 1000; // 5 minutes (spec requirement)
     this.pollIntervalMs = 1000; // 1 second
   }
 
   async connect() {
     try {
-      this.mongoClient = new MongoClient(process.env.MONGODB_URI);
-      await this.mongoClient.connect();
+      // One pooled client per process, shared by every worker in it
+      this.mongoClient = await getMongoClient('phoenix-workers');
       this.db = this.mongoClient.db('phoenix');
+      // Fire-and-forget handle for the 1Hz heartbeat: a lost beat is
+      // harmless, waiting for an ack on every poll is not
+      this.heartbeats = this.db.collection('workers', { writeConcern: { w: 0 } });
+      this.logBuffer = new LogBuffer(this.db.collection('logs'));
       
-      // Register worker
+      // Register worker (acknowledged, so the doc is guaranteed to exist)
       await this.db.collection('workers').updateOne(
         { workerId: this.workerId },
         { 
@@ -69,9 +91,9 @@ export class PhoenixBaseWorker {
             workerId: this.workerId,
             name: this.name,
             taskTypes: this.taskTypes,
-            status: 'ONLINE',
-            lastHeartbeat: new Date()
-          }
+            status: 'ONLINE'
+          },
+          $currentDate: { lastHeartbeat: true }
         },
         { upsert: true }
       );
@@ -84,16 +106,19 @@ export class PhoenixBaseWorker {
     }
   }
 
-  // Immutable log entry (spec requirement)
-  async log(level, message, workflowId = null, taskId = null) {
-    await this.db.collection('logs').insertOne({
-      timestamp: new Date().toISOString(),
+  // Immutable log entry (spec requirement), written in batches
+  async log(level, message, workflowId = null, taskId = null, eventType = null) {
+    const entry = {
+      timestamp: new Date(),
       level,
       component: `${this.name}_${this.workerId.slice(-4)}`,
       message,
       workflow_id: workflowId,
       task_id: taskId
-    });
+    };
+    // Only tagged events carry the field (partial index on event_type)
+    if (eventType) entry.event_type = eventType;
+    this.logBuffer.push(entry);
   }
 
   // ATOMIC DISTRIBUTED LOCK (spec section 5.2)
@@ -130,10 +155,7 @@ export class PhoenixBaseWorker {
     while (this.isRunning) {
       try {
         // Update heartbeat
-        await this.db.collection('workers').updateOne(
-          { workerId: this.workerId },
-          { $set: { lastHeartbeat: new Date(), status: 'ONLINE' } }
-        );
+        await this.heartbeats.updateOne(this.heartbeatFilter, this.heartbeatUpdate);
 
         // Try to claim a task
         const task = await this.claimTask();
@@ -142,11 +164,11 @@ export class PhoenixBaseWorker {
           await this.executeTask(task);
         }
 
-        await this.sleep(this.pollIntervalMs);
+        await this.waitForNextPoll(this.pollIntervalMs);
       } catch (error) {
         logger.error(`Poll error: ${error.message}`);
         await this.log(LogLevel.ERROR, `Poll error: ${error.message}`, null, null);
-        await this.sleep(5000); // Back off on error
+        await this.waitForNextPoll(5000); // Back off on error
       }
     }
   }
@@ -185,7 +207,8 @@ export class PhoenixBaseWorker {
         LogLevel.INFO,
         `Task completed in ${Date.now() - startTime}ms`,
         task.workflow_id,
-        task._id.toString()
+        task._id.toString(),
+        task.retry_count > 0 ? LogEvent.RECOVERY_SUCCESS : null
       );
 
       logger.info(`Task ${task._id} completed successfully`);
@@ -200,14 +223,17 @@ export class PhoenixBaseWorker {
     const newRetryCount = (task.retry_count || 0) + 1;
     const maxRetries = task.max_retries || 3;
 
+    const willRetry = newRetryCount <= maxRetries;
+
     await this.log(
       LogLevel.ERROR,
       `Task failed: ${error.message} (retry ${newRetryCount}/${maxRetries})`,
       task.workflow_id,
-      task._id.toString()
+      task._id.toString(),
+      willRetry ? LogEvent.RECOVERY_ATTEMPT : LogEvent.TASK_FAILED
     );
 
-    if (newRetryCount <= maxRetries) {
+    if (willRetry) {
       // Reset to PENDING for retry
       await this.db.collection('tasks').updateOne(
         { _id: task._id },
@@ -264,16 +290,32 @@ export class PhoenixBaseWorker {
     return new Promise(resolve => setTimeout(resolve, ms));
   }
 
+  // Poll-loop wait that shutdown() can cut short. Returns at once if
+  // shutdown already happened mid-iteration (before this wait started).
+  waitForNextPoll(ms) {
+    if (!this.isRunning) return Promise.resolve();
+    return new Promise(resolve => {
+      const done = () => {
+        clearTimeout(timer);
+        this.wakePoller = null;
+        resolve();
+      };
+      const timer = setTimeout(done, ms);
+      this.wakePoller = done;
+    });
+  }
+
   async shutdown() {
     this.isRunning = false;
+    this.wakePoller?.();
     
     await this.db.collection('workers').updateOne(
       { workerId: this.workerId },
-      { $set: { status: 'OFFLINE', lastHeartbeat: new Date() } }
+      { $set: { status: 'OFFLINE' }, $currentDate: { lastHeartbeat: true } }
     );
 
     await this.log(LogLevel.INFO, `Worker ${this.name} shutting down`, null, null);
-    await this.mongoClient.close();
+    await this.logBuffer.close();
     logger.info(`Worker ${this.name} shut down`);
   }
 }
\ No newline at end of file
@@ -2,7 +2,6 @@
 // Worker Manager aligned with Project Phoenix spec
 import express from 'express';
 import cors from 'cors';
-import cors from 'cors';
 import { 
   SearcherWorker, 
   SummarizerWorker, 
@@ -12,7 +11,9 @@ import {
   ValidatorWorker,
   PlannerWorker
 } from './PhoenixWorkers.js';
-import { TaskStatus, LogLevel } from './PhoenixBaseWorker.js';
+import { TaskStatus } from './PhoenixBaseWorker.js';
+import { getDatabase, closeMongoClient } from '../db/connection.js';
+import { ensureIndexes } from '../db/indexes.js';
 import winston from 'winston';
 
 const logger = winston.createLogger({
@@ -29,6 +30,8 @@ const logger = winston.createLogger({
 export class PhoenixWorkerManager {
   constructor() {
     this.workers = new Map();
+    this.stopping = new Map(); // workerId -> in-flight shutdown promise
+    this.db = null;
     this.app = express();
     
     // CORS - Allow frontend (localhost:3000) to access backend
@@ -98,42 +101,62 @@ export class PhoenixWorkerManager {
       }
     });
 
-    // Stop worker
-    this.app.post('/workers/:workerId/stop', async (req, res) => {
-      const worker = this.workers.get(req.params.workerId);
+    // Stop worker. Responds once the worker is detached; the OFFLINE
+    // write and log flush finish in the background. Repeat calls while
+    // that is in flight are answered the same way.
+    this.app.post('/workers/:workerId/stop', (req, res) => {
+      const { workerId } = req.params;
+      if (this.stopping.has(workerId)) return res.json({ stopped: true });
+
+      const worker = this.workers.get(workerId);
       if (!worker) return res.status(404).json({ error: 'Worker not found' });
-      await worker.shutdown();
-      this.workers.delete(req.params.workerId);
+
+      this.workers.delete(workerId);
+      this.stopping.set(workerId, worker.shutdown()
+        .catch(err => logger.error(`Worker ${workerId} shutdown error: ${err.message}`))
+        .finally(() => this.stopping.delete(workerId)));
       res.json({ stopped: true });
     });
 
     // Get logs (for frontend)
     this.app.get('/logs', async (req, res) => {
-      const { workflow_id, limit = 50 } = req.query;
-      const worker = Array.from(this.workers.values())[0];
-      if (!worker?.db) return res.status(500).json({ error: 'No DB connection' });
+      const { workflow_id, event_type, limit = 50 } = req.query;
+      if (!this.db) return res.status(500).json({ error: 'No DB connection' });
 
       const filter = workflow_id ? { workflow_id } : {};
-      const logs = await worker.db.collection('logs')
-        .find(filter)
-        .sort({ timestamp: -1 })
-        .limit(parseInt(limit))
-        .toArray();
-      
-      res.json(logs);
+      // e.g. ?event_type=recovery_attempt,recovery_success or repeated
+      // ?event_type=a&event_type=b; nested objects are rejected
+      if (event_type) {
+        const types = [].concat(event_type);
+        if (!types.every(t => typeof t === 'string')) {
+          return res.status(400).json({ error: 'event_type must be a string' });
+        }
+        filter.event_type = { $in: types.flatMap(t => t.split(',')) };
+      }
+
+      try {
+        const logs = await this.db.collection('logs')
+          .find(filter)
+          .sort({ timestamp: -1 })
+          .limit(parseInt(limit))
+          .toArray();
+        
+        res.json(logs);
+      } catch (error) {
+        res.status(500).json({ error: error.message });
+      }
     });
 
     // Get tasks (for frontend)
     this.app.get('/tasks', async (req, res) => {
       const { workflow_id, status } = req.query;
-      const worker = Array.from(this.workers.values())[0];
-      if (!worker?.db) return res.status(500).json({ error: 'No DB connection' });
+      if (!this.db) return res.status(500).json({ error: 'No DB connection' });
 
       const filter = {};
       if (workflow_id) filter.workflow_id = workflow_id;
       if (status) filter.status = status;
 
-      const tasks = await worker.db.collection('tasks')
+      const tasks = await this.db.collection('tasks')
         .find(filter)
         .sort({ created_at: 1 })
         .toArray();
@@ -143,8 +166,7 @@ export class PhoenixWorkerManager {
 
     // Manual task trigger (for demo)
     this.app.post('/tasks', async (req, res) => {
-      const worker = Array.from(this.workers.values())[0];
-      if (!worker?.db) return res.status(500).json({ error: 'No DB connection' });
+      if (!this.db) return res.status(500).json({ error: 'No DB connection' });
 
       const task = {
         _id: req.body._id || `task_${Date.now()}`,
@@ -162,7 +184,7 @@ export class PhoenixWorkerManager {
         created_at: new Date()
       };
 
-      await worker.db.collection('tasks').insertOne(task);
+      await this.db.collection('tasks').insertOne(task);
       res.json({ created: true, task });
     });
   }
@@ -222,6 +244,11 @@ export class PhoenixWorkerManager {
 
     logger.info('🐦‍🔥 Starting Phoenix Worker Fleet...');
 
+    // Connect the shared client up front so the pool is warm before
+    // the first worker or HTTP request needs it
+    this.db = await getDatabase('phoenix-workers');
+    await ensureIndexes(this.db);
+
     for (const type of workerTypes) {
       try {
         const worker = await this.spawnWorker(type);
@@ -244,6 +271,8 @@ export class PhoenixWorkerManager {
       await worker.shutdown();
     }
     this.workers.clear();
+    await Promise.all(this.stopping.values());
+    await closeMongoClient();
     logger.info('All workers shut down');
   }
 }
\ No newline at end of file
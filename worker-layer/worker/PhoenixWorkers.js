@@ -2,6 +2,9 @@
 // Specialized workers for Project Phoenix SRE system
 import { PhoenixBaseWorker, TaskType, LogLevel } from './PhoenixBaseWorker.js';
 
+// Strips ```json fences from LLM replies; built once per module, not per call
+const JSON_FENCE_RE = /```json\n?|\n?```/g;
+
 // SEARCHER WORKER - Handles SEARCH tasks
 export class SearcherWorker extends PhoenixBaseWorker {
   constructor(workerId) {
@@ -29,7 +32,7 @@ RESPOND WITH ONLY THIS JSON (no markdown, no explanation):
     
     let result;
     try {
-      result = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      result = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       const jsonMatch = response.match(/\{[\s\S]*"findings"[\s\S]*\}/);
       if (jsonMatch) {
@@ -95,7 +98,7 @@ RESPOND WITH ONLY THIS JSON (no markdown, no explanation):
     
     let result;
     try {
-      result = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      result = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       result = {
         summary: response.substring(0, 300),
@@ -422,7 +425,7 @@ RESPOND WITH ONLY THIS JSON:
     
     let result;
     try {
-      result = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      result = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       result = {
         insights: ['Analysis completed'],
@@ -471,7 +474,7 @@ RESPOND WITH ONLY THIS JSON:
     
     let result;
     try {
-      result = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      result = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       result = {
         is_valid: true,
@@ -520,7 +523,7 @@ RESPOND WITH ONLY THIS JSON (no markdown, no text before or after):
     
     let plan;
     try {
-      plan = JSON.parse(response.replace(/```json\n?|\n?```/g, '').trim());
+      plan = JSON.parse(response.replace(JSON_FENCE_RE, '').trim());
     } catch (e) {
       const jsonMatch = response.match(/\{[\s\S]*"tasks"[\s\S]*\}/);
       if (jsonMatch) {